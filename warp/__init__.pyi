@@ -3118,7 +3118,9 @@ def tile_diag_add(a: Tile[Any, Tuple[int, int]], d: Tile[Any, Tuple[int]]) -> Ti
     ...
 
 @over
-def tile_matmul(a: Tile[Float, Tuple[int, int]], b: Tile[Float, Tuple[int, int]], out: Tile[Float, Tuple[int, int]]):
+def tile_matmul(
+    a: Tile[Float, Tuple[int, int]], b: Tile[Float, Tuple[int, int]], out: Tile[Float, Tuple[int, int]], precision: str
+):
     """Computes the matrix product and accumulates ``out += a*b``.
 
     Supported datatypes are:
@@ -3128,15 +3130,24 @@ def tile_matmul(a: Tile[Float, Tuple[int, int]], b: Tile[Float, Tuple[int, int]]
     All input and output tiles must have the same datatype. Tile data will automatically be migrated
     to shared memory if necessary and will use TensorCore operations when available.
 
+    When ``precision="tf32"``, float32 operands are rounded to TF32 (10-bit mantissa) before the multiplication
+    so that TensorCore operations can be used on devices with compute capability 8.0 or higher. Accumulation
+    is still performed in float32. This setting has no effect on the CPU, when Warp is built without MathDx,
+    or when the ``enable_mathdx`` module option is ``False``.
+
     :param a: A tile with ``shape=(M, K)``
     :param b: A tile with ``shape=(K, N)``
     :param out: A tile with ``shape=(M, N)``
+    :param precision: The compute precision: ``"default"`` to compute in the precision of the inputs
+      or ``"tf32"`` to use TF32 TensorCore operations for float32 inputs.
 
     """
     ...
 
 @over
-def tile_matmul(a: Tile[Float, Tuple[int, int]], b: Tile[Float, Tuple[int, int]]) -> Tile[Float, Tuple[int, int]]:
+def tile_matmul(
+    a: Tile[Float, Tuple[int, int]], b: Tile[Float, Tuple[int, int]], precision: str
+) -> Tile[Float, Tuple[int, int]]:
     """Computes the matrix product ``out = a*b``.
 
     Supported datatypes are:
@@ -3146,8 +3157,15 @@ def tile_matmul(a: Tile[Float, Tuple[int, int]], b: Tile[Float, Tuple[int, int]]
     Both input tiles must have the same datatype. Tile data will automatically be migrated
     to shared memory if necessary and will use TensorCore operations when available.
 
+    When ``precision="tf32"``, float32 operands are rounded to TF32 (10-bit mantissa) before the multiplication
+    so that TensorCore operations can be used on devices with compute capability 8.0 or higher. Accumulation
+    is still performed in float32. This setting has no effect on the CPU, when Warp is built without MathDx,
+    or when the ``enable_mathdx`` module option is ``False``.
+
     :param a: A tile with ``shape=(M, K)``
     :param b: A tile with ``shape=(K, N)``
+    :param precision: The compute precision: ``"default"`` to compute in the precision of the inputs
+      or ``"tf32"`` to use TF32 TensorCore operations for float32 inputs.
     :returns: A tile with ``shape=(M, N)``
 
     """
@@ -3159,7 +3177,8 @@ def tile_fft(inout: Tile[Vector[2, Float], Tuple[int, int]]) -> Tile[Vector[2, F
 
     This function cooperatively computes the forward FFT on a tile of data inplace, treating each row individually.
 
-    Note that computing the adjoint is not yet supported.
+    Computing the adjoint is supported on the CPU, when Warp is built without MathDx, or when the
+    ``enable_mathdx`` module option is ``False``, but not yet with MathDx.
 
     Supported datatypes are:
         * vec2f, vec2d
@@ -3174,7 +3193,8 @@ def tile_ifft(inout: Tile[Vector[2, Float], Tuple[int, int]]) -> Tile[Vector[2,
 
     This function cooperatively computes the inverse FFT on a tile of data inplace, treating each row individually.
 
-    Note that computing the adjoint is not yet supported.
+    Computing the adjoint is supported on the CPU, when Warp is built without MathDx, or when the
+    ``enable_mathdx`` module option is ``False``, but not yet with MathDx.
 
     Supported datatypes are:
         * vec2f, vec2d
@@ -3184,13 +3204,16 @@ def tile_ifft(inout: Tile[Vector[2, Float], Tuple[int, int]]) -> Tile[Vector[2,
     ...
 
 @over
-def tile_cholesky(A: Tile[Float, Tuple[int, int]]) -> Tile[Float, Tuple[int, int]]:
+def tile_cholesky(A: Tile[Float, Tuple[int, int]], fill_mode: str) -> Tile[Float, Tuple[int, int]]:
     """Compute the Cholesky factorization L of a matrix A.
     L is lower triangular and satisfies LL^T = A.
 
     Only the lower triangular portion of A is used for the decomposition;
     the upper triangular part may be left unspecified.
 
+    With ``fill_mode="upper"`` the upper triangular factor U is computed instead,
+    it satisfies U^T U = A and only the upper triangular portion of A is used.
+
     Note that computing the adjoint is not yet supported.
 
     Supported datatypes are:
@@ -3198,23 +3221,30 @@ def tile_cholesky(A: Tile[Float, Tuple[int, int]]) -> Tile[Float, Tuple[int, int
         * float64
 
     :param A: A square, symmetric positive-definite, matrix. Only the lower triangular part of A is needed; the upper part is ignored.
-    :returns L: A square, lower triangular, matrix, such that LL^T = A
+    :param fill_mode: Which triangle of A is used and returned, either ``"lower"`` (default) or ``"upper"``
+    :returns L: A square, lower triangular, matrix, such that LL^T = A, or an upper triangular
+        matrix U such that U^T U = A if ``fill_mode`` is ``"upper"``
     """
     ...
 
 @over
-def tile_cholesky_solve(L: Tile[Float, Tuple[int, int]], y: Tile[Float, Tuple[int]]):
+def tile_cholesky_solve(L: Tile[Float, Tuple[int, int]], y: Tile[Float, Tuple[int]], fill_mode: str):
     """With L such that LL^T = A, solve for x in Ax = y
 
+    With ``fill_mode="upper"`` the factor is instead the upper triangular U returned by
+    ``tile_cholesky(A, fill_mode="upper")``, such that U^T U = A.
+
     Note that computing the adjoint is not yet supported.
 
     Supported datatypes are:
         * float32
         * float64
 
-    :param L: A square, lower triangular, matrix, such that LL^T = A
+    :param L: The factor returned by ``tile_cholesky()``, a square, lower triangular, matrix such that
+        LL^T = A, or an upper triangular matrix U such that U^T U = A if ``fill_mode`` is ``"upper"``
     :param y: A 1D or 2D tile of length M
-    :returns x: A tile of the same shape as y such that LL^T x = y
+    :param fill_mode: Which triangle the factor is stored in, either ``"lower"`` (default) or ``"upper"``
+    :returns x: A tile of the same shape as y such that A x = y
     """
     ...
 
@@ -161,6 +161,7 @@ def clear_lto_cache() -> None:
 
     The LTO cache is stored within a subdirectory of the kernel cache directory.
     This function only clears the cache for the current Warp version.
+    LTO code already loaded by the current process is discarded as well.
     """
 
     warp.context.init()
@@ -170,6 +171,8 @@ def clear_lto_cache() -> None:
     is_intialized = warp.context.runtime is not None
     assert is_intialized, "The kernel cache directory is not configured; wp.init() has not been called yet or failed."
 
+    _lto_cache.clear()
+
     lto_path = os.path.join(warp.config.kernel_cache_dir, "lto")
     if os.path.isdir(lto_path):
         # Remove the lto directory and its contents
@@ -214,6 +217,11 @@ def get_lto_cache_dir():
     return lto_dir
 
 
+# LTO outputs built or loaded by this process, keyed by LTO symbol, so that
+# modules sharing an LTO do not read it back from the cache directory again
+_lto_cache = {}
+
+
 def get_cached_lto(path):
     if os.path.exists(path):
         with open(path, "rb") as f:
@@ -251,6 +259,10 @@ def _build_lto_base(lto_symbol, compile_func, builder, extra_files=None):
     if extra_files is None:
         extra_files = {}
 
+    # Check if already built or loaded by this process
+    if lto_symbol in _lto_cache:
+        return _lto_cache[lto_symbol]
+
     # Hash symbol and set up paths
     h = hash_symbol(lto_symbol)
     lto_dir = get_lto_cache_dir()
@@ -282,10 +294,8 @@ def _build_lto_base(lto_symbol, compile_func, builder, extra_files=None):
                 break
 
         if all_files_cached:
-            if not extra_files:
-                return (lto_code_data,)
-            else:
-                return (lto_code_data, *[extra_files[ext] for ext in extra_files.keys()])
+            _lto_cache[lto_symbol] = (lto_code_data, *[extra_files[ext] for ext in extra_files.keys()])
+            return _lto_cache[lto_symbol]
 
     # Create process-dependent temporary build directory
     build_dir = f"{lto_dir}_p{os.getpid()}"
@@ -325,13 +335,13 @@ def _build_lto_base(lto_symbol, compile_func, builder, extra_files=None):
 
         shutil.rmtree(build_dir, ignore_errors=True)
 
-    if not extra_files:
-        return (outputs[".lto"],)
-    else:
-        return (outputs[".lto"], *[outputs[ext] for ext in extra_files.keys()])
+    _lto_cache[lto_symbol] = (outputs[".lto"], *[outputs[ext] for ext in extra_files.keys()])
+    return _lto_cache[lto_symbol]
 
 
-def build_lto_dot(M, N, K, adtype, bdtype, cdtype, alayout, blayout, clayout, arch, num_threads, builder):
+def build_lto_dot(
+    M, N, K, adtype, bdtype, cdtype, alayout, blayout, clayout, arch, num_threads, builder, precision="default"
+):
     arch = 120 if arch > 121 else arch
 
     # Maps Python/Warp types to C++ types and enums
@@ -360,6 +370,14 @@ def build_lto_dot(M, N, K, adtype, bdtype, cdtype, alayout, blayout, clayout, ar
     (a_dtype, a_prec, a_type) = cublasdx_type_map(adtype)
     (b_dtype, b_prec, b_type) = cublasdx_type_map(bdtype)
     (c_dtype, c_prec, c_type) = cublasdx_type_map(cdtype)
+
+    # TF32 TensorCore operations are available from sm_80 onwards, float32 operands
+    # keep their storage type and are rounded to TF32 by cuBLASDx when loaded
+    if precision == "tf32" and arch >= 80:
+        if adtype == float32:
+            a_prec = 4  # COMMONDX_PRECISION_TF32
+        if bdtype == float32:
+            b_prec = 4  # COMMONDX_PRECISION_TF32
     a_arrangement = cublasdx_arrangement_map(alayout)
     b_arrangement = cublasdx_arrangement_map(blayout)
     c_arrangement = cublasdx_arrangement_map(clayout)
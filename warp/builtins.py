@@ -7400,6 +7400,16 @@ add_builtin(
 ##
 
 
+def tile_matmul_check_precision(a, b, precision):
+    if precision not in {"default", "tf32"}:
+        raise ValueError(f"Invalid value for 'precision': {precision!r}. Expected 'default' or 'tf32'.")
+
+    if precision == "tf32" and (a.dtype != float32 or b.dtype != float32):
+        raise TypeError(
+            f"tile_matmul() with precision='tf32' requires tiles of float32 entries, got {a.dtype!r} and {b.dtype!r}"
+        )
+
+
 def tile_matmul_out_value_func(arg_types, arg_values):
     # return generic type (for doc builds)
     if arg_types is None:
@@ -7417,6 +7427,8 @@ def tile_matmul_out_value_func(arg_types, arg_values):
     if not is_tile(arg_types["out"]):
         raise TypeError(f"tile_matmul() 'out' argument must be a tile, got {arg_types['out']!r}")
 
+    tile_matmul_check_precision(a, b, arg_values["precision"])
+
     return None
 
 
@@ -7434,6 +7446,8 @@ def tile_matmul_value_func(arg_types, arg_values):
     if not is_tile(b):
         raise TypeError(f"tile_matmul() 'b' argument must be a tile, got {b!r}")
 
+    tile_matmul_check_precision(a, b, arg_values["precision"])
+
     return tile(dtype=a.dtype, shape=(a.shape[0], b.shape[1]), storage="shared")
 
 
@@ -7447,6 +7461,7 @@ def tile_matmul_lto_dispatch_func(
 ):
     a = arg_values["a"]
     b = arg_values["b"]
+    precision = arg_values["precision"].constant
 
     if len(return_values) > 0:
         accumulate = 0  # for c = tile_matmul(a,b) case we want to overwrite c value
@@ -7481,7 +7496,7 @@ def tile_matmul_lto_dispatch_func(
     num_threads = options["block_dim"]
     arch = options["output_arch"]
 
-    if arch is None or not warp.context.runtime.core.wp_is_mathdx_enabled():
+    if arch is None or not options["enable_mathdx"] or not warp.context.runtime.core.wp_is_mathdx_enabled():
         # CPU/no-MathDx dispatch
         return ((0, 0, 0, a, b, out), template_args, [], 0)
     else:
@@ -7507,6 +7522,7 @@ def tile_matmul_lto_dispatch_func(
             arch,
             num_threads,
             builder,
+            precision=precision,
         )
         if warp.config.enable_backward:
             # adjA += adjC * B^T - Transpose ~= flipped layout
@@ -7523,6 +7539,7 @@ def tile_matmul_lto_dispatch_func(
                 arch,
                 num_threads,
                 builder,
+                precision=precision,
             )
             # adjB += A^T * adjC - Transpose ~= flipped layout
             (fun_backward_B, lto_backward_B) = warp.build.build_lto_dot(
@@ -7538,6 +7555,7 @@ def tile_matmul_lto_dispatch_func(
                 arch,
                 num_threads,
                 builder,
+                precision=precision,
             )
         else:
             # adjoints aren't computed, so we reuse fun_forward as a dummy arg
@@ -7565,7 +7583,9 @@ add_builtin(
         "a": tile(dtype=Float, shape=Tuple[int, int]),
         "b": tile(dtype=Float, shape=Tuple[int, int]),
         "out": tile(dtype=Float, shape=Tuple[int, int]),
+        "precision": str,
     },
+    defaults={"precision": "default"},
     value_func=tile_matmul_out_value_func,
     lto_dispatch_func=tile_matmul_lto_dispatch_func,
     variadic=False,
@@ -7578,9 +7598,16 @@ add_builtin(
     All input and output tiles must have the same datatype. Tile data will automatically be migrated
     to shared memory if necessary and will use TensorCore operations when available.
 
+    When ``precision="tf32"``, float32 operands are rounded to TF32 (10-bit mantissa) before the multiplication
+    so that TensorCore operations can be used on devices with compute capability 8.0 or higher. Accumulation
+    is still performed in float32. This setting has no effect on the CPU, when Warp is built without MathDx,
+    or when the ``enable_mathdx`` module option is ``False``.
+
     :param a: A tile with ``shape=(M, K)``
     :param b: A tile with ``shape=(K, N)``
     :param out: A tile with ``shape=(M, N)``
+    :param precision: The compute precision: ``"default"`` to compute in the precision of the inputs
+      or ``"tf32"`` to use TF32 TensorCore operations for float32 inputs.
     """,
     group="Tile Primitives",
     export=False,
@@ -7588,7 +7615,12 @@ add_builtin(
 
 add_builtin(
     "tile_matmul",
-    input_types={"a": tile(dtype=Float, shape=Tuple[int, int]), "b": tile(dtype=Float, shape=Tuple[int, int])},
+    input_types={
+        "a": tile(dtype=Float, shape=Tuple[int, int]),
+        "b": tile(dtype=Float, shape=Tuple[int, int]),
+        "precision": str,
+    },
+    defaults={"precision": "default"},
     value_func=tile_matmul_value_func,
     lto_dispatch_func=tile_matmul_lto_dispatch_func,
     variadic=False,
@@ -7601,8 +7633,15 @@ add_builtin(
     Both input tiles must have the same datatype. Tile data will automatically be migrated
     to shared memory if necessary and will use TensorCore operations when available.
 
+    When ``precision="tf32"``, float32 operands are rounded to TF32 (10-bit mantissa) before the multiplication
+    so that TensorCore operations can be used on devices with compute capability 8.0 or higher. Accumulation
+    is still performed in float32. This setting has no effect on the CPU, when Warp is built without MathDx,
+    or when the ``enable_mathdx`` module option is ``False``.
+
     :param a: A tile with ``shape=(M, K)``
     :param b: A tile with ``shape=(K, N)``
+    :param precision: The compute precision: ``"default"`` to compute in the precision of the inputs
+      or ``"tf32"`` to use TF32 TensorCore operations for float32 inputs.
     :returns: A tile with ``shape=(M, N)``
     """,
     group="Tile Primitives",
@@ -7671,9 +7710,18 @@ def tile_fft_generic_lto_dispatch_func(
     arch = options["output_arch"]
     ept = size // num_threads
 
-    if arch is None or not warp.context.runtime.core.wp_is_mathdx_enabled():
-        # CPU/no-MathDx dispatch
-        return ([], [], [], 0)
+    if arch is None or not options["enable_mathdx"] or not warp.context.runtime.core.wp_is_mathdx_enabled():
+        # CPU/no-MathDx dispatch, radix-2 FFT performed in shared memory
+        if (size & (size - 1)) != 0:
+            raise ValueError(
+                "tile_fft() requires the FFT size to be a power of two when Warp is not built with MathDx "
+                f"or the enable_mathdx module option is False, got {size}"
+            )
+
+        # shared memory holds a copy of the tile and a table of size - 1 twiddle factors
+        twiddle_bytes = tile.round_up((size - 1) * type_size_in_bytes(inout.type.dtype))
+
+        return ((inout,), [], [], inout.type.size_in_bytes() + twiddle_bytes)
     else:
         # generate the LTO
         lto_symbol, lto_code_data, shared_memory_bytes = warp.build.build_lto_fft(
@@ -7705,7 +7753,8 @@ add_builtin(
 
     This function cooperatively computes the forward FFT on a tile of data inplace, treating each row individually.
 
-    Note that computing the adjoint is not yet supported.
+    Computing the adjoint is supported on the CPU, when Warp is built without MathDx, or when the
+    ``enable_mathdx`` module option is ``False``, but not yet with MathDx.
 
     Supported datatypes are:
         * vec2f, vec2d
@@ -7726,7 +7775,8 @@ add_builtin(
 
     This function cooperatively computes the inverse FFT on a tile of data inplace, treating each row individually.
 
-    Note that computing the adjoint is not yet supported.
+    Computing the adjoint is supported on the CPU, when Warp is built without MathDx, or when the
+    ``enable_mathdx`` module option is ``False``, but not yet with MathDx.
 
     Supported datatypes are:
         * vec2f, vec2d
@@ -7745,8 +7795,8 @@ def tile_cholesky_generic_value_func(arg_types, arg_values):
     if arg_types is None:
         return tile(dtype=Float, shape=Tuple[int, int])
 
-    if len(arg_types) != 1:
-        raise TypeError("tile_cholesky() requires 1 positional args")
+    if len(arg_types) != 2:
+        raise TypeError("tile_cholesky() requires exactly 2 args, 'A' and 'fill_mode'")
 
     a = arg_types["A"]
 
@@ -7759,6 +7809,8 @@ def tile_cholesky_generic_value_func(arg_types, arg_values):
     if a.shape[0] != a.shape[1]:
         raise ValueError("tile_cholesky() argument must be square")
 
+    tile_cholesky_check_fill_mode("tile_cholesky", arg_values["fill_mode"])
+
     return tile(dtype=a.dtype, shape=a.shape, layout=a.layout, strides=a.strides, storage="shared")
 
 
@@ -7773,6 +7825,11 @@ cusolver_side_map = {"-": -1, "left": 0, "right": 1}
 cusolver_diag_map = {"-": -1, "unit": 0, "nounit": 1}
 
 
+def tile_cholesky_check_fill_mode(name, fill_mode):
+    if fill_mode not in ("lower", "upper"):
+        raise ValueError(f"{name}() 'fill_mode' argument must be either 'lower' or 'upper', got {fill_mode!r}")
+
+
 def tile_cholesky_generic_lto_dispatch_func(
     arg_types: Mapping[str, type],
     return_type: Any,
@@ -7804,15 +7861,16 @@ def tile_cholesky_generic_lto_dispatch_func(
 
     side_enum = cusolver_side_map["-"]
     diag_enum = cusolver_diag_map["-"]
-    fill_mode = cusolver_fill_mode_map["lower"]
+    fill_mode = cusolver_fill_mode_map[arg_values["fill_mode"].constant]
+    template_args = [int(arg_values["fill_mode"].constant == "upper")]
 
     arch = options["output_arch"]
     num_threads = options["block_dim"]
     parameter_list = f"({dtype}*, int*)"
 
-    if arch is None or not warp.context.runtime.core.wp_is_mathdx_enabled():
+    if arch is None or not options["enable_mathdx"] or not warp.context.runtime.core.wp_is_mathdx_enabled():
         # CPU/no-MathDx dispatch
-        return ((0, a, out), [], [], 0)
+        return ((0, a, out), template_args, [], 0)
     else:
         # generate the LTO
         lto_symbol, lto_code_data = warp.build.build_lto_solver(
@@ -7833,12 +7891,13 @@ def tile_cholesky_generic_lto_dispatch_func(
             builder,
         )
 
-        return ((Var(lto_symbol, str, False, True, False), a, out), [], [lto_code_data], 0)
+        return ((Var(lto_symbol, str, False, True, False), a, out), template_args, [lto_code_data], 0)
 
 
 add_builtin(
     "tile_cholesky",
-    input_types={"A": tile(dtype=Float, shape=Tuple[int, int])},
+    input_types={"A": tile(dtype=Float, shape=Tuple[int, int]), "fill_mode": str},
+    defaults={"fill_mode": "lower"},
     value_func=tile_cholesky_generic_value_func,
     lto_dispatch_func=tile_cholesky_generic_lto_dispatch_func,
     variadic=True,
@@ -7848,6 +7907,9 @@ add_builtin(
     Only the lower triangular portion of A is used for the decomposition;
     the upper triangular part may be left unspecified.
 
+    With ``fill_mode="upper"`` the upper triangular factor U is computed instead,
+    it satisfies U^T U = A and only the upper triangular portion of A is used.
+
     Note that computing the adjoint is not yet supported.
 
     Supported datatypes are:
@@ -7855,7 +7917,9 @@ add_builtin(
         * float64
 
     :param A: A square, symmetric positive-definite, matrix. Only the lower triangular part of A is needed; the upper part is ignored.
-    :returns L: A square, lower triangular, matrix, such that LL^T = A""",
+    :param fill_mode: Which triangle of A is used and returned, either ``"lower"`` (default) or ``"upper"``
+    :returns L: A square, lower triangular, matrix, such that LL^T = A, or an upper triangular
+        matrix U such that U^T U = A if ``fill_mode`` is ``"upper"``""",
     group="Tile Primitives",
     export=False,
     namespace="",
@@ -7866,8 +7930,8 @@ def tile_cholesky_solve_generic_value_func(arg_types, arg_values):
     if arg_types is None:
         return None
 
-    if len(arg_types) != 2:
-        raise TypeError("tile_cholesky_solve() requires exactly 2 positional args")
+    if len(arg_types) != 3:
+        raise TypeError("tile_cholesky_solve() requires exactly 3 args, 'L', 'y' and 'fill_mode'")
 
     l = arg_types["L"]
     y = arg_types["y"]
@@ -7893,6 +7957,8 @@ def tile_cholesky_solve_generic_value_func(arg_types, arg_values):
             f"got {y.shape[0]} elements in 'x' and {l.shape[0]} rows in 'L'"
         )
 
+    tile_cholesky_check_fill_mode("tile_cholesky_solve", arg_values["fill_mode"])
+
     return tile(dtype=l.dtype, shape=y.shape, layout=y.layout, strides=y.strides, storage="shared")
 
 
@@ -7936,15 +8002,16 @@ def tile_cholesky_solve_generic_lto_dispatch_func(
 
     side_enum = cusolver_side_map["-"]
     diag_enum = cusolver_diag_map["-"]
-    fill_mode = cusolver_fill_mode_map["lower"]
+    fill_mode = cusolver_fill_mode_map[arg_values["fill_mode"].constant]
+    template_args = [int(arg_values["fill_mode"].constant == "upper")]
 
     arch = options["output_arch"]
     num_threads = options["block_dim"]
     parameter_list = f"({dtype}*, {dtype}*)"
 
-    if arch is None or not warp.context.runtime.core.wp_is_mathdx_enabled():
+    if arch is None or not options["enable_mathdx"] or not warp.context.runtime.core.wp_is_mathdx_enabled():
         # CPU/no-MathDx dispatch
-        return ((0, L, y, x), [], [], 0)
+        return ((0, L, y, x), template_args, [], 0)
     else:
         # generate the LTO
         lto_symbol, lto_code_data = warp.build.build_lto_solver(
@@ -7965,26 +8032,36 @@ def tile_cholesky_solve_generic_lto_dispatch_func(
             builder,
         )
 
-        return ((Var(lto_symbol, str, False, True, False), L, y, x), [], [lto_code_data], 0)
+        return ((Var(lto_symbol, str, False, True, False), L, y, x), template_args, [lto_code_data], 0)
 
 
 add_builtin(
     "tile_cholesky_solve",
-    input_types={"L": tile(dtype=Float, shape=Tuple[int, int]), "y": tile(dtype=Float, shape=Tuple[int])},
+    input_types={
+        "L": tile(dtype=Float, shape=Tuple[int, int]),
+        "y": tile(dtype=Float, shape=Tuple[int]),
+        "fill_mode": str,
+    },
+    defaults={"fill_mode": "lower"},
     value_func=tile_cholesky_solve_generic_value_func,
     lto_dispatch_func=tile_cholesky_solve_generic_lto_dispatch_func,
     variadic=True,
     doc="""With L such that LL^T = A, solve for x in Ax = y
 
+    With ``fill_mode="upper"`` the factor is instead the upper triangular U returned by
+    ``tile_cholesky(A, fill_mode="upper")``, such that U^T U = A.
+
     Note that computing the adjoint is not yet supported.
 
     Supported datatypes are:
         * float32
         * float64
 
-    :param L: A square, lower triangular, matrix, such that LL^T = A
+    :param L: The factor returned by ``tile_cholesky()``, a square, lower triangular, matrix such that
+        LL^T = A, or an upper triangular matrix U such that U^T U = A if ``fill_mode`` is ``"upper"``
     :param y: A 1D or 2D tile of length M
-    :returns x: A tile of the same shape as y such that LL^T x = y""",
+    :param fill_mode: Which triangle the factor is stored in, either ``"lower"`` (default) or ``"upper"``
+    :returns x: A tile of the same shape as y such that A x = y""",
     group="Tile Primitives",
     export=False,
     namespace="",
@@ -8037,7 +8114,7 @@ def tile_lower_solve_generic_lto_dispatch_func(
     num_threads = options["block_dim"]
     parameter_list = f"({dtype}*, {dtype}*)"
 
-    if arch is None or not warp.context.runtime.core.wp_is_mathdx_enabled():
+    if arch is None or not options["enable_mathdx"] or not warp.context.runtime.core.wp_is_mathdx_enabled():
         # CPU/no-MathDx dispatch
         return ((0, L, y, z), [], [], 0)
     else:
@@ -8168,7 +8245,7 @@ def tile_upper_solve_generic_lto_dispatch_func(
     num_threads = options["block_dim"]
     parameter_list = f"({dtype}*, {dtype}*)"
 
-    if arch is None or not warp.context.runtime.core.wp_is_mathdx_enabled():
+    if arch is None or not options["enable_mathdx"] or not warp.context.runtime.core.wp_is_mathdx_enabled():
         # CPU/no-MathDx dispatch
         return ((0, U, z, x), [], [], 0)
     else:
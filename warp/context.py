@@ -1854,6 +1854,10 @@ class ModuleBuilder:
         else:
             source = warp.codegen.cuda_module_header.format(block_dim=self.options["block_dim"]) + source
 
+            if not self.options["enable_mathdx"]:
+                # use the scalar tile fallbacks even if Warp was built with MathDx
+                source = "#undef WP_ENABLE_MATHDX\n#define WP_ENABLE_MATHDX 0\n" + source
+
         return source
 
 
@@ -2007,6 +2011,7 @@ class Module:
             "mode": warp.config.mode,
             "block_dim": 256,
             "compile_time_trace": warp.config.compile_time_trace,
+            "enable_mathdx": True,
         }
 
         # Module dependencies are determined by scanning each function
@@ -6233,6 +6238,7 @@ def set_module_options(options: dict[str, Any], module: Any = None):
     * **mode**: The compilation mode to use, can be "debug", or "release", defaults to the value of ``warp.config.mode``.
     * **max_unroll**: The maximum fixed-size loop to unroll, defaults to the value of ``warp.config.max_unroll``.
     * **block_dim**: The default number of threads to assign to each block
+    * **enable_mathdx**: If ``False``, tile matmul, FFT and solver builtins use Warp's own implementations instead of MathDx, defaults to ``True``.
 
     Args:
 
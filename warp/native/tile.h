@@ -1500,6 +1500,8 @@ inline CUDA_CALLABLE void adj_print(const tile_shared_t<T, L, Owner>& t, const t
 template <typename T, typename Shape, typename Strides, bool RequiresGrad>
 inline CUDA_CALLABLE auto tile_alloc_empty()
 {
+    // note: shared tiles are allocated densely (no leading dimension padding),
+    // MathDx routines receive the raw pointer and assume ld == the tile's leading dimension
     constexpr int size = Shape::size();
     T* data = (T*)tile_alloc_shared(size*sizeof(T));
     T* grad = nullptr;
@@ -2446,7 +2448,8 @@ inline CUDA_CALLABLE void scalar_cholesky_forward_substitution(TileL& L, TileX&
         constexpr int n = TileL::Layout::Shape::dim(1);
         constexpr int m = TileY::Layout::Shape::dim(1);
 
-        for (int k=0; k < m; ++k)
+        // right-hand sides are independent, distribute columns across threads
+        for (int k=WP_TILE_THREAD_IDX; k < m; k += WP_TILE_BLOCK_DIM)
         {
             for (int i=0; i < n; ++i)
             {
@@ -2459,6 +2462,8 @@ inline CUDA_CALLABLE void scalar_cholesky_forward_substitution(TileL& L, TileX&
                 X.data(tile_coord(i,k)) = (diag != T(0.0f)) ? s / diag : s;
             }
         }
+
+        WP_TILE_SYNC();
     }
 }
 
@@ -2488,7 +2493,8 @@ inline CUDA_CALLABLE void scalar_cholesky_back_substitution(TileL& L, TileX& X)
         constexpr int n = TileL::Layout::Shape::dim(1);
         constexpr int m = TileX::Layout::Shape::dim(1);
 
-        for (int k=0; k < m; ++k)
+        // right-hand sides are independent, distribute columns across threads
+        for (int k=WP_TILE_THREAD_IDX; k < m; k += WP_TILE_BLOCK_DIM)
         {
             for (int i=n-1; i >= 0; --i)
             {
@@ -2501,6 +2507,8 @@ inline CUDA_CALLABLE void scalar_cholesky_back_substitution(TileL& L, TileX& X)
                 X.data(tile_coord(i,k)) = (diag != T(0.0f)) ? s / diag : s;
             }
         }
+
+        WP_TILE_SYNC();
     }
 }
 
@@ -2598,11 +2606,154 @@ void adj_tile_matmul(Fwd fun_forward, AdjA fun_backward_A, AdjB fun_backward_B,
 
 #if !defined(__CUDA_ARCH__) || WP_ENABLE_MATHDX == 0
 
-#define tile_fft()
-#define tile_ifft()
+namespace partitioned_fft
+{
 
-#define adj_tile_fft()
-#define adj_tile_ifft()
+template <typename T>
+struct scalar_type_t;
+
+template <typename Type>
+struct scalar_type_t<vec_t<2, Type>>
+{
+    using T = Type;
+};
+
+inline CUDA_CALLABLE constexpr int ilog2(int n)
+{
+    int r = 0;
+
+    while (n > 1)
+    {
+        n >>= 1;
+        ++r;
+    }
+
+    return r;
+}
+
+template <int NumBits>
+inline CUDA_CALLABLE int bit_reverse(int x)
+{
+    int r = 0;
+
+    WP_PRAGMA_UNROLL
+    for (int i=0; i < NumBits; ++i)
+    {
+        r = (r << 1) | (x & 1);
+        x >>= 1;
+    }
+
+    return r;
+}
+
+// radix-2 decimation-in-time FFT along the rows of a register tile, the
+// entries are scattered to their bit-reversed position in shared memory,
+// all butterfly stages are then performed in-place in shared memory before
+// the result is gathered back to registers
+// butterflies are evaluated in the Accum precision which defaults to the
+// scalar type of the tile, i.e.: float32 for vec2f and float64 for vec2d
+template <bool Inverse, typename Tile, typename Accum=typename scalar_type_t<typename Tile::Type>::T>
+inline CUDA_CALLABLE void scalar_fft(Tile& inout)
+{
+    using T = typename Tile::Type;
+    using Real = typename scalar_type_t<T>::T;
+
+    constexpr int Batch = Tile::Layout::Shape::dim(0);
+    constexpr int N = Tile::Layout::Shape::dim(1);
+    constexpr int LogN = ilog2(N);
+
+    static_assert((1 << LogN) == N, "Expected FFT size to be a power of two");
+
+    T* smem = (T*)tile_alloc_shared(Batch*N*int(sizeof(T)));
+
+    // twiddle factors for all stages are computed once up-front, stage s uses the
+    // 2^s entries starting at 2^s - 1, i.e.: twiddles[half_m - 1 + k] = exp(-2*pi*i*k/(2*half_m))
+    // (conjugated for the inverse transform)
+    T* twiddles = (T*)tile_alloc_shared((N - 1)*int(sizeof(T)));
+
+    const Accum sign = Inverse ? Accum(1.0) : Accum(-1.0);
+
+    for (int t=WP_TILE_THREAD_IDX; t < N - 1; t += WP_TILE_BLOCK_DIM)
+    {
+        const int s = ilog2(t + 1);
+        const int half_m = 1 << s;
+        const int k = t - (half_m - 1);
+
+        const Accum angle = sign*Accum(6.28318530717958647692)*Accum(k)/Accum(2*half_m);
+        twiddles[t] = T(Real(wp::cos(angle)), Real(wp::sin(angle)));
+    }
+
+    inout.apply([&](int reg, auto c) { smem[c[0]*N + bit_reverse<LogN>(c[1])] = inout.data[reg]; });
+
+    WP_TILE_SYNC();
+
+    // the number of stages is known at compile time
+    WP_PRAGMA_UNROLL
+    for (int s=0; s < LogN; ++s)
+    {
+        const int half_m = 1 << s;
+
+        // each butterfly combines entries i and i + half_m of a row
+        for (int t=WP_TILE_THREAD_IDX; t < Batch*N/2; t += WP_TILE_BLOCK_DIM)
+        {
+            const int row = t/(N/2);
+            const int b = t%(N/2);
+            const int k = b & (half_m - 1);
+            const int i = row*N + ((b >> s) << (s + 1)) + k;
+
+            const T tw = twiddles[half_m - 1 + k];
+            const T u = smem[i];
+            const T v = smem[i + half_m];
+
+            const Accum wr = Accum(tw[0]);
+            const Accum wi = Accum(tw[1]);
+            const Accum vr = Accum(v[0]);
+            const Accum vi = Accum(v[1]);
+
+            // t = w*v
+            const Accum tr = wr*vr - wi*vi;
+            const Accum ti = wr*vi + wi*vr;
+
+            smem[i] = T(Real(Accum(u[0]) + tr), Real(Accum(u[1]) + ti));
+            smem[i + half_m] = T(Real(Accum(u[0]) - tr), Real(Accum(u[1]) - ti));
+        }
+
+        WP_TILE_SYNC();
+    }
+
+    inout.apply([&](int reg, auto c) { inout.data[reg] = smem[c[0]*N + c[1]]; });
+
+    WP_TILE_SYNC();
+
+    tile_alloc_shared(-(N - 1)*int(sizeof(T)));
+    tile_alloc_shared(-Batch*N*int(sizeof(T)));
+}
+
+} // namespace partitioned_fft
+
+template <typename Tile>
+inline CUDA_CALLABLE void tile_fft(Tile& inout)
+{
+    partitioned_fft::scalar_fft<false>(inout);
+}
+
+template <typename Tile>
+inline CUDA_CALLABLE void tile_ifft(Tile& inout)
+{
+    partitioned_fft::scalar_fft<true>(inout);
+}
+
+template <typename Tile, typename AdjTile>
+inline CUDA_CALLABLE void adj_tile_fft(Tile& inout, AdjTile& adj_inout)
+{
+    partitioned_fft::scalar_fft<true>(adj_inout);
+}
+
+template <typename Tile, typename AdjTile>
+inline CUDA_CALLABLE void adj_tile_ifft(Tile& inout, AdjTile& adj_inout)
+{
+    partitioned_fft::scalar_fft<false>(adj_inout);
+}
 
 #else
 
@@ -2643,7 +2794,7 @@ void adj_tile_matmul(Fwd fun_forward, AdjA fun_backward_A, AdjB fun_backward_B,
 
 #endif // !defined(__CUDA_ARCH__)
 
-template <typename Fwd, typename TileA, typename TileL>
+template <int Upper, typename Fwd, typename TileA, typename TileL>
 TileL& tile_cholesky(Fwd fun_forward, TileA& A, TileL& L)
 {
     static_assert(TileA::Layout::Shape::N == 2, "Expected TileA::Layout::Shape::N == 2");
@@ -2659,7 +2810,18 @@ TileL& tile_cholesky(Fwd fun_forward, TileA& A, TileL& L)
 
 #if !defined(__CUDA_ARCH__) || WP_ENABLE_MATHDX == 0
 
-    partitioned_gemm::scalar_cholesky(A, L);
+    if constexpr (Upper)
+    {
+        // U^T U = A, the lower factor of the transposed view A^T is U^T, so factor
+        // transposed views of A and L, this only reads the upper triangle of A
+        auto At = tile_transpose(A);
+        auto Ut = tile_transpose(L);
+        partitioned_gemm::scalar_cholesky(At, Ut);
+    }
+    else
+    {
+        partitioned_gemm::scalar_cholesky(A, L);
+    }
 
 #else
 
@@ -2684,14 +2846,14 @@ TileL& tile_cholesky(Fwd fun_forward, TileA& A, TileL& L)
     }
 #endif
 
-    // Zero-out the upper triangular part of L
+    // Zero-out the unused triangular part of L
 
     WP_PRAGMA_UNROLL
     for (int i=WP_TILE_THREAD_IDX; i < TileL::Layout::Size; i += WP_TILE_BLOCK_DIM)
     {
         auto c = TileL::Layout::coord_from_linear(i);
         
-        if(c[0] < c[1]) 
+        if(Upper ? c[0] > c[1] : c[0] < c[1]) 
             L.data(c) = 0.0;
     }
 
@@ -2708,7 +2870,7 @@ TileL& tile_cholesky(Fwd fun_forward, TileA& A, TileL& L)
         assert(false); \
     } while (0)
 
-template <typename Fwd, typename TileL, typename TileX, typename TileY>
+template <int Upper, typename Fwd, typename TileL, typename TileX, typename TileY>
 TileY& tile_cholesky_solve(Fwd fun_forward, TileL& L, TileX& Y, TileY& X)
 {       
     // Copy y to x
@@ -2717,7 +2879,16 @@ TileY& tile_cholesky_solve(Fwd fun_forward, TileL& L, TileX& Y, TileY& X)
 
 #if !defined(__CUDA_ARCH__) || WP_ENABLE_MATHDX == 0
 
-    partitioned_gemm::scalar_cholesky_solve(L, X, Y);
+    if constexpr (Upper)
+    {
+        // U^T U = A, solve with the lower triangular view U^T
+        auto Ut = tile_transpose(L);
+        partitioned_gemm::scalar_cholesky_solve(Ut, X, Y);
+    }
+    else
+    {
+        partitioned_gemm::scalar_cholesky_solve(L, X, Y);
+    }
 
 #else
 
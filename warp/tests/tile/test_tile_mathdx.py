@@ -15,6 +15,7 @@
 
 import functools
 import unittest
+from typing import Any
 
 import numpy as np
 
@@ -27,6 +28,14 @@ TILE_M = wp.constant(8)
 TILE_N = wp.constant(4)
 TILE_K = wp.constant(8)
 
+# Tensor Core (WMMA) compatible matmul shape
+TILE_MMA_M = wp.constant(16)
+TILE_MMA_N = wp.constant(16)
+TILE_MMA_K = wp.constant(16)
+
+# TF32 Tensor Core compatible matmul depth
+TILE_TF32_K = wp.constant(8)
+
 # num threads per-tile
 TILE_DIM = 32
 FFT_SIZE_FP32 = 64
@@ -35,6 +44,59 @@ FFT_SIZE_FP64 = 64
 
 @wp.kernel()
 def tile_math_matmul_kernel(
+    ga: wp.array2d(dtype=wp.float16), gb: wp.array2d(dtype=wp.float16), gc: wp.array2d(dtype=wp.float32)
+):
+    i, j = wp.tid()
+    a = wp.tile_load(ga, shape=(TILE_MMA_M, TILE_MMA_K), offset=(i * TILE_MMA_M, j * TILE_MMA_K))
+    b = wp.tile_load(gb, shape=(TILE_MMA_K, TILE_MMA_N), offset=(i * TILE_MMA_K, j * TILE_MMA_N))
+    c = wp.tile_zeros(shape=(TILE_MMA_M, TILE_MMA_N), dtype=wp.float32)
+    wp.tile_matmul(a, b, c)
+    wp.tile_store(gc, c, offset=(i * TILE_MMA_M, j * TILE_MMA_N))
+
+
+@unittest.skipUnless(
+    wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
+)
+def test_tile_math_matmul(test, device):
+    rng = np.random.default_rng(42)
+
+    A = rng.random((TILE_MMA_M, TILE_MMA_K), dtype=np.float64).astype(np.float16)
+    B = rng.random((TILE_MMA_K, TILE_MMA_N), dtype=np.float64).astype(np.float16)
+
+    A_wp = wp.array(A, requires_grad=True, device=device)
+    B_wp = wp.array(B, requires_grad=True, device=device)
+    C_wp = wp.zeros((TILE_MMA_M, TILE_MMA_N), dtype=wp.float32, requires_grad=True, device=device)
+
+    with wp.Tape() as tape:
+        wp.launch_tiled(
+            tile_math_matmul_kernel,
+            dim=[1, 1],
+            inputs=[A_wp, B_wp, C_wp],
+            block_dim=TILE_DIM,
+            device=device,
+        )
+
+    # the forward pass accumulates the fp16 inputs in fp32, compute the reference the same way
+    A_f32 = A.astype(np.float32)
+    B_f32 = B.astype(np.float32)
+
+    # verify forward pass
+    assert_np_equal(C_wp.numpy(), A_f32 @ B_f32, tol=1e-2)
+
+    adj_C = np.ones((TILE_MMA_M, TILE_MMA_N), dtype=np.float32)
+
+    tape.backward(grads={C_wp: wp.array(adj_C, device=device)})
+
+    # the gradients are fp16 and the scalar fallback also accumulates them in fp16,
+    # every term of the sums may add one fp16 rounding error (2^-11 relative)
+    adj_A = adj_C @ B_f32.T
+    adj_B = A_f32.T @ adj_C
+    assert_np_equal(A_wp.grad.numpy(), adj_A, tol=TILE_MMA_N * 2.0**-11 * np.abs(adj_A).max())
+    assert_np_equal(B_wp.grad.numpy(), adj_B, tol=TILE_MMA_M * 2.0**-11 * np.abs(adj_B).max())
+
+
+@wp.kernel()
+def tile_math_matmul_mixed_kernel(
     ga: wp.array2d(dtype=wp.float16), gb: wp.array2d(dtype=wp.float32), gc: wp.array2d(dtype=wp.float64)
 ):
     i, j = wp.tid()
@@ -48,20 +110,19 @@ def tile_math_matmul_kernel(
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_matmul(test, device):
+def test_tile_math_matmul_mixed(test, device):
     rng = np.random.default_rng(42)
 
     A = rng.random((TILE_M, TILE_K), dtype=np.float64).astype(np.float16)
     B = rng.random((TILE_K, TILE_N), dtype=np.float32)
-    C = np.zeros((TILE_M, TILE_N), dtype=np.float64)
 
     A_wp = wp.array(A, requires_grad=True, device=device)
     B_wp = wp.array(B, requires_grad=True, device=device)
-    C_wp = wp.array(C, requires_grad=True, device=device)
+    C_wp = wp.zeros((TILE_M, TILE_N), dtype=wp.float64, requires_grad=True, device=device)
 
     with wp.Tape() as tape:
         wp.launch_tiled(
-            tile_math_matmul_kernel,
+            tile_math_matmul_mixed_kernel,
             dim=[1, 1],
             inputs=[A_wp, B_wp, C_wp],
             block_dim=TILE_DIM,
@@ -71,7 +132,7 @@ def test_tile_math_matmul(test, device):
     # verify forward pass
     assert_np_equal(C_wp.numpy(), A @ B, tol=1e-2)
 
-    adj_C = np.ones_like(C)
+    adj_C = np.ones((TILE_M, TILE_N), dtype=np.float64)
 
     tape.backward(grads={C_wp: wp.array(adj_C, device=device)})
 
@@ -79,6 +140,42 @@ def test_tile_math_matmul(test, device):
     assert_np_equal(B_wp.grad.numpy(), A.T @ adj_C, tol=1e-2)
 
 
+@wp.kernel()
+def tile_math_matmul_tf32_kernel(
+    ga: wp.array2d(dtype=wp.float32), gb: wp.array2d(dtype=wp.float32), gc: wp.array2d(dtype=wp.float32)
+):
+    i, j = wp.tid()
+    a = wp.tile_load(ga, shape=(TILE_MMA_M, TILE_TF32_K), offset=(i * TILE_MMA_M, j * TILE_TF32_K))
+    b = wp.tile_load(gb, shape=(TILE_TF32_K, TILE_MMA_N), offset=(i * TILE_TF32_K, j * TILE_MMA_N))
+    c = wp.tile_matmul(a, b, precision="tf32")
+    wp.tile_store(gc, c, offset=(i * TILE_MMA_M, j * TILE_MMA_N))
+
+
+@unittest.skipUnless(
+    wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
+)
+def test_tile_math_matmul_tf32(test, device):
+    rng = np.random.default_rng(42)
+
+    A = rng.random((TILE_MMA_M, TILE_TF32_K), dtype=np.float32)
+    B = rng.random((TILE_TF32_K, TILE_MMA_N), dtype=np.float32)
+
+    A_wp = wp.array(A, device=device)
+    B_wp = wp.array(B, device=device)
+    C_wp = wp.zeros((TILE_MMA_M, TILE_MMA_N), dtype=wp.float32, device=device)
+
+    wp.launch_tiled(
+        tile_math_matmul_tf32_kernel,
+        dim=[1, 1],
+        inputs=[A_wp, B_wp, C_wp],
+        block_dim=TILE_DIM,
+        device=device,
+    )
+
+    # TF32 only keeps a 10-bit mantissa for the operands
+    assert_np_equal(C_wp.numpy(), A @ B, tol=1e-2)
+
+
 @wp.kernel()
 def tile_math_fft_kernel_vec2f(gx: wp.array2d(dtype=wp.vec2f), gy: wp.array2d(dtype=wp.vec2f)):
     i, j = wp.tid()
@@ -95,7 +192,49 @@ def tile_math_fft_kernel_vec2d(gx: wp.array2d(dtype=wp.vec2d), gy: wp.array2d(dt
     wp.tile_store(gy, xy)
 
 
-@unittest.skipUnless(wp.context.runtime.core.wp_is_mathdx_enabled(), "Warp was not built with MathDx support")
+@wp.kernel()
+def tile_math_ifft_kernel_vec2f(gx: wp.array2d(dtype=wp.vec2f), gy: wp.array2d(dtype=wp.vec2f)):
+    i, j = wp.tid()
+    xy = wp.tile_load(gx, shape=(FFT_SIZE_FP32, FFT_SIZE_FP32))
+    wp.tile_ifft(xy)
+    wp.tile_store(gy, xy)
+
+
+@wp.kernel()
+def tile_math_ifft_kernel_vec2d(gx: wp.array2d(dtype=wp.vec2d), gy: wp.array2d(dtype=wp.vec2d)):
+    i, j = wp.tid()
+    xy = wp.tile_load(gx, shape=(FFT_SIZE_FP64, FFT_SIZE_FP64))
+    wp.tile_ifft(xy)
+    wp.tile_store(gy, xy)
+
+
+@wp.kernel()
+def tile_math_fft_ifft_kernel_vec2f(gx: wp.array2d(dtype=wp.vec2f), gy: wp.array2d(dtype=wp.vec2f)):
+    i, j = wp.tid()
+    xy = wp.tile_load(gx, shape=(FFT_SIZE_FP32, FFT_SIZE_FP32))
+    wp.tile_fft(xy)
+    wp.tile_ifft(xy)
+    wp.tile_store(gy, xy)
+
+
+@wp.kernel()
+def tile_math_fft_ifft_kernel_vec2d(gx: wp.array2d(dtype=wp.vec2d), gy: wp.array2d(dtype=wp.vec2d)):
+    i, j = wp.tid()
+    xy = wp.tile_load(gx, shape=(FFT_SIZE_FP64, FFT_SIZE_FP64))
+    wp.tile_fft(xy)
+    wp.tile_ifft(xy)
+    wp.tile_store(gy, xy)
+
+
+def uses_native_tile_math(device):
+    # whether the tile math builtins of this module run Warp's own implementations on the device
+    return (
+        device.is_cpu
+        or not wp.get_module_options()["enable_mathdx"]
+        or not wp.context.runtime.core.wp_is_mathdx_enabled()
+    )
+
+
 def test_tile_math_fft(test, device, wp_dtype):
     np_real_dtype = {wp.vec2f: np.float32, wp.vec2d: np.float64}[wp_dtype]
     np_cplx_dtype = {wp.vec2f: np.complex64, wp.vec2d: np.complex128}[wp_dtype]
@@ -108,88 +247,158 @@ def test_tile_math_fft(test, device, wp_dtype):
     # so we use 2 float32 to represent a single complex64 number and then convert it to vec2f
 
     X = rng.random((fft_size, 2 * fft_size), dtype=np_real_dtype)
-    Y = np.zeros_like(X)
 
     X_wp = wp.array2d(X, requires_grad=True, dtype=wp_dtype, device=device)
-    Y_wp = wp.array2d(Y, requires_grad=True, dtype=wp_dtype, device=device)
+    Y_wp = wp.zeros_like(X_wp)
+
+    with wp.Tape() as tape:
+        wp.launch_tiled(kernel, dim=[1, 1], inputs=[X_wp, Y_wp], block_dim=TILE_DIM, device=device)
 
     X_c64 = X.view(np_cplx_dtype).reshape(fft_size, fft_size)
     Y_c64 = np.fft.fft(X_c64, axis=-1)
 
+    Y_wp_c64 = Y_wp.numpy().view(np_cplx_dtype).reshape(fft_size, fft_size)
+
+    assert_np_equal(Y_wp_c64, Y_c64, tol=1.0e-4)
+
+    # TODO: implement the backward pass with MathDx, its adjoint reapplies the forward transform
+    if uses_native_tile_math(device):
+        adj_Y = rng.random((fft_size, 2 * fft_size), dtype=np_real_dtype)
+
+        tape.backward(grads={Y_wp: wp.array2d(adj_Y, dtype=wp_dtype, device=device)})
+
+        # the adjoint of the DFT is the unnormalized inverse DFT
+        adj_Y_c64 = adj_Y.view(np_cplx_dtype).reshape(fft_size, fft_size)
+        adj_X_c64 = X_wp.grad.numpy().view(np_cplx_dtype).reshape(fft_size, fft_size)
+
+        assert_np_equal(adj_X_c64 / fft_size, np.fft.ifft(adj_Y_c64, axis=-1), tol=1.0e-4)
+
+
+def test_tile_math_ifft(test, device, wp_dtype):
+    np_real_dtype = {wp.vec2f: np.float32, wp.vec2d: np.float64}[wp_dtype]
+    np_cplx_dtype = {wp.vec2f: np.complex64, wp.vec2d: np.complex128}[wp_dtype]
+    ifft_kernel = {wp.vec2d: tile_math_ifft_kernel_vec2d, wp.vec2f: tile_math_ifft_kernel_vec2f}[wp_dtype]
+    fft_ifft_kernel = {wp.vec2d: tile_math_fft_ifft_kernel_vec2d, wp.vec2f: tile_math_fft_ifft_kernel_vec2f}[wp_dtype]
+    fft_size = {wp.vec2d: FFT_SIZE_FP64, wp.vec2f: FFT_SIZE_FP32}[wp_dtype]
+
+    rng = np.random.default_rng(42)
+
+    X = rng.random((fft_size, 2 * fft_size), dtype=np_real_dtype)
+
+    X_wp = wp.array2d(X, requires_grad=True, dtype=wp_dtype, device=device)
+    Y_wp = wp.zeros_like(X_wp)
+    Z_wp = wp.zeros_like(X_wp)
+
     with wp.Tape() as tape:
-        wp.launch_tiled(kernel, dim=[1, 1], inputs=[X_wp, Y_wp], block_dim=TILE_DIM, device=device)
+        wp.launch_tiled(ifft_kernel, dim=[1, 1], inputs=[X_wp, Y_wp], block_dim=TILE_DIM, device=device)
 
+    # forward followed by inverse transform in the same kernel
+    wp.launch_tiled(fft_ifft_kernel, dim=[1, 1], inputs=[X_wp, Z_wp], block_dim=TILE_DIM, device=device)
+
+    X_c64 = X.view(np_cplx_dtype).reshape(fft_size, fft_size)
+
+    # the inverse transform is not normalized, both results are scaled by the FFT size
     Y_wp_c64 = Y_wp.numpy().view(np_cplx_dtype).reshape(fft_size, fft_size)
+    Z_wp_c64 = Z_wp.numpy().view(np_cplx_dtype).reshape(fft_size, fft_size)
 
-    assert_np_equal(Y_wp_c64, Y_c64, tol=1.0e-4)
+    assert_np_equal(Y_wp_c64 / fft_size, np.fft.ifft(X_c64, axis=-1), tol=1.0e-4)
+    assert_np_equal(Z_wp_c64 / fft_size, X_c64, tol=1.0e-4)
 
-    # TODO: implement and test backward pass
+    # TODO: implement the backward pass with MathDx, its adjoint reapplies the inverse transform
+    if uses_native_tile_math(device):
+        adj_Y = rng.random((fft_size, 2 * fft_size), dtype=np_real_dtype)
 
+        tape.backward(grads={Y_wp: wp.array2d(adj_Y, dtype=wp_dtype, device=device)})
+
+        # the adjoint of the unnormalized inverse DFT is the forward DFT
+        adj_Y_c64 = adj_Y.view(np_cplx_dtype).reshape(fft_size, fft_size)
+        adj_X_c64 = X_wp.grad.numpy().view(np_cplx_dtype).reshape(fft_size, fft_size)
+
+        assert_np_equal(adj_X_c64 / fft_size, np.fft.fft(adj_Y_c64, axis=-1) / fft_size, tol=1.0e-4)
 
-@wp.kernel()
-def tile_math_cholesky(
-    gA: wp.array2d(dtype=wp.float64),
-    gD: wp.array1d(dtype=wp.float64),
-    gL: wp.array2d(dtype=wp.float64),
-    gy: wp.array1d(dtype=wp.float64),
-    gx: wp.array1d(dtype=wp.float64),
-):
-    i, j = wp.tid()
-    # Load A, D & y
-    a = wp.tile_load(gA, shape=(TILE_M, TILE_M), storage="shared")
-    d = wp.tile_load(gD, shape=TILE_M, storage="shared")
-    y = wp.tile_load(gy, shape=TILE_M, storage="shared")
-    # Ensure tile_diag_add() and tile_cholesky_solve() work with transposed matrices
-    a_t = wp.tile_transpose(a)
-    # Compute L st LL^T = A^T + diag(D)
-    b = wp.tile_diag_add(a_t, d)
-    l = wp.tile_cholesky(b)
-    # Solve for y in LL^T x = y
-    x = wp.tile_cholesky_solve(l, y)
-    # Store L & y
-    wp.tile_store(gL, l)
-    wp.tile_store(gx, x)
+
+def create_tile_math_cholesky_kernel(tile_m: int, fill_mode: str, dtype):
+    @wp.kernel(module="unique")
+    def tile_math_cholesky(
+        gA: wp.array2d(dtype=dtype),
+        gD: wp.array1d(dtype=dtype),
+        gL: wp.array2d(dtype=dtype),
+        gy: wp.array1d(dtype=dtype),
+        gx: wp.array1d(dtype=dtype),
+    ):
+        i, j = wp.tid()
+        # Load A, D & y
+        a = wp.tile_load(gA, shape=(tile_m, tile_m), storage="shared")
+        d = wp.tile_load(gD, shape=tile_m, storage="shared")
+        y = wp.tile_load(gy, shape=tile_m, storage="shared")
+        # Ensure tile_diag_add() and tile_cholesky_solve() work with transposed matrices
+        a_t = wp.tile_transpose(a)
+        # Compute L st LL^T = A^T + diag(D)
+        b = wp.tile_diag_add(a_t, d)
+        l = wp.tile_cholesky(b, fill_mode=wp.static(fill_mode))
+        # Solve for y in LL^T x = y
+        x = wp.tile_cholesky_solve(l, y, fill_mode=wp.static(fill_mode))
+        # Store L & y
+        wp.tile_store(gL, l)
+        wp.tile_store(gx, x)
+
+    return use_test_module_backend(tile_math_cholesky)
 
 
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_cholesky(test, device):
-    A_h = np.ones((TILE_M, TILE_M), dtype=np.float64)
-    D_h = 8.0 * np.ones(TILE_M, dtype=np.float64)
-    L_h = np.zeros_like(A_h)
-    Y_h = np.arange(TILE_M, dtype=np.float64)
-    X_h = np.zeros_like(Y_h)
-
-    A_np = A_h.T + np.diag(D_h)
-    L_np = np.linalg.cholesky(A_np)
-    X_np = np.linalg.solve(A_np, Y_h)
-
-    A_wp = wp.array2d(A_h, requires_grad=True, dtype=wp.float64, device=device)
-    D_wp = wp.array2d(D_h, requires_grad=True, dtype=wp.float64, device=device)
-    L_wp = wp.array2d(L_h, requires_grad=True, dtype=wp.float64, device=device)
-    Y_wp = wp.array2d(Y_h, requires_grad=True, dtype=wp.float64, device=device)
-    X_wp = wp.array2d(X_h, requires_grad=True, dtype=wp.float64, device=device)
+def test_tile_math_cholesky(test, device, M, fill_mode="lower", dtype=wp.float64):
+    # large tiles exceed the default 48KB of shared memory per block, the module
+    # opts in to the device's maximum dynamic shared memory when it is loaded
+    # a, b and l are MxM shared tiles, d, y and x are length M shared tiles
+    smem_bytes = (3 * M * M + 3 * M) * wp.types.type_size_in_bytes(dtype)
+    if device.is_cuda and wp.context.runtime.core.wp_cuda_get_max_shared_memory(device.context) < smem_bytes:
+        test.skipTest(f"Device does not support {smem_bytes} bytes of shared memory per block")
+
+    tile_math_cholesky = create_tile_math_cholesky_kernel(M, fill_mode, dtype)
+    tol = 1e-4 if dtype == wp.float32 else 1e-6
+
+    Y_h = np.arange(M, dtype=np.float64)
+
+    # the kernel factors A^T + diag(D), fill the triangle of A^T excluded by fill_mode with NaNs,
+    # the results must match the symmetric reference as long as that triangle is never read
+    if fill_mode == "upper":
+        unused = np.triu(np.ones((M, M), dtype=bool), k=1)
+    else:
+        unused = np.tril(np.ones((M, M), dtype=bool), k=-1)
+    A_h = np.where(unused, np.nan, 1.0)
+
+    A_wp = wp.array2d(A_h, requires_grad=True, dtype=dtype, device=device)
+    D_wp = wp.full(M, 8.0, dtype=dtype, requires_grad=True, device=device)
+    L_wp = wp.zeros_like(A_wp)
+    Y_wp = wp.array2d(Y_h, requires_grad=True, dtype=dtype, device=device)
+    X_wp = wp.zeros_like(Y_wp)
 
     wp.launch_tiled(
         tile_math_cholesky, dim=[1, 1], inputs=[A_wp, D_wp, L_wp, Y_wp, X_wp], block_dim=TILE_DIM, device=device
     )
-    wp.synchronize_device(device)
 
-    np.testing.assert_allclose(X_wp.numpy(), X_np)
-    np.testing.assert_allclose(L_wp.numpy(), L_np)
+    A_np = np.ones((M, M)) + 8.0 * np.eye(M)
+    L_np = np.linalg.cholesky(A_np)
+    if fill_mode == "upper":
+        L_np = L_np.T
+    X_np = np.linalg.solve(A_np, Y_h)
+
+    assert_np_equal(X_wp.numpy(), X_np, tol=tol)
+    assert_np_equal(L_wp.numpy(), L_np, tol=tol)
 
     # TODO: implement and test backward pass
 
 
 @wp.kernel()
 def tile_math_cholesky_multiple_rhs(
-    gA: wp.array2d(dtype=wp.float64),
-    gD: wp.array1d(dtype=wp.float64),
-    gL: wp.array2d(dtype=wp.float64),
-    gy: wp.array2d(dtype=wp.float64),
-    gx: wp.array2d(dtype=wp.float64),
-    gz: wp.array2d(dtype=wp.float64),
+    gA: wp.array2d(dtype=Any),
+    gD: wp.array1d(dtype=Any),
+    gL: wp.array2d(dtype=Any),
+    gy: wp.array2d(dtype=Any),
+    gx: wp.array2d(dtype=Any),
+    gz: wp.array2d(dtype=Any),
 ):
     i, j = wp.tid()
     # Load A, D & y
@@ -215,25 +424,19 @@ def tile_math_cholesky_multiple_rhs(
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_cholesky_multiple_rhs(test, device):
-    A_h = np.ones((TILE_M, TILE_M), dtype=np.float64)
-    D_h = 8.0 * np.ones(TILE_M, dtype=np.float64)
-    L_h = np.zeros_like(A_h)
-    Y_h = np.arange((TILE_M, TILE_M), dtype=np.float64)
-    X_h = np.zeros_like(Y_h)
-    Z_h = np.zeros_like(Y_h)
+def test_tile_math_cholesky_multiple_rhs(test, device, dtype=wp.float64):
+    tol = 1e-4 if dtype == wp.float32 else 1e-6
 
-    A_np = A_h.T + np.diag(D_h)
-    L_np = np.linalg.cholesky(A_np)
-    X_np = np.linalg.solve(A_np, Y_h.T)
-    Z_np = X_np @ X_np
+    # scaled to [0, 1) so the entries of Z = X @ X stay within the float32 tolerance
+    Y_h = np.arange(TILE_M * TILE_M, dtype=np.float64).reshape(TILE_M, TILE_M) / (TILE_M * TILE_M)
 
-    A_wp = wp.array2d(A_h, requires_grad=True, dtype=wp.float64, device=device)
-    D_wp = wp.array2d(D_h, requires_grad=True, dtype=wp.float64, device=device)
-    L_wp = wp.array2d(L_h, requires_grad=True, dtype=wp.float64, device=device)
-    Y_wp = wp.array2d(Y_h, requires_grad=True, dtype=wp.float64, device=device)
-    X_wp = wp.array2d(X_h, requires_grad=True, dtype=wp.float64, device=device)
-    Z_wp = wp.array2d(Z_h, requires_grad=True, dtype=wp.float64, device=device)
+    # constant inputs are filled on the device, no host copy needed
+    A_wp = wp.ones((TILE_M, TILE_M), dtype=dtype, requires_grad=True, device=device)
+    D_wp = wp.full(TILE_M, 8.0, dtype=dtype, requires_grad=True, device=device)
+    L_wp = wp.zeros_like(A_wp)
+    Y_wp = wp.array2d(Y_h, requires_grad=True, dtype=dtype, device=device)
+    X_wp = wp.zeros_like(Y_wp)
+    Z_wp = wp.zeros_like(Y_wp)
 
     wp.launch_tiled(
         tile_math_cholesky_multiple_rhs,
@@ -242,19 +445,21 @@ def test_tile_math_cholesky_multiple_rhs(test, device):
         block_dim=TILE_DIM,
         device=device,
     )
-    wp.synchronize_device(device)
 
-    np.testing.assert_allclose(L_wp.numpy(), L_np)
-    np.testing.assert_allclose(X_wp.numpy(), X_np)
-    np.testing.assert_allclose(Z_wp.numpy(), Z_np)
+    A_np = np.ones((TILE_M, TILE_M)) + 8.0 * np.eye(TILE_M)
+    L_np = np.linalg.cholesky(A_np)
+    X_np = np.linalg.solve(A_np, Y_h.T)
+    Z_np = X_np @ X_np
+
+    assert_np_equal(L_wp.numpy(), L_np, tol=tol)
+    assert_np_equal(X_wp.numpy(), X_np, tol=tol)
+    assert_np_equal(Z_wp.numpy(), Z_np, tol=tol)
 
     # TODO: implement and test backward pass
 
 
 @wp.kernel
-def tile_math_forward_substitution(
-    gL: wp.array2d(dtype=wp.float64), gx: wp.array1d(dtype=wp.float64), gz: wp.array1d(dtype=wp.float64)
-):
+def tile_math_forward_substitution(gL: wp.array2d(dtype=Any), gx: wp.array1d(dtype=Any), gz: wp.array1d(dtype=Any)):
     i, j = wp.tid()
     # Load L & x
     L = wp.tile_load(gL, shape=(TILE_M, TILE_M), storage="shared")
@@ -269,37 +474,37 @@ def tile_math_forward_substitution(
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_forward_substitution(test, device):
+def test_tile_math_forward_substitution(test, device, dtype=wp.float64):
+    np_dtype = wp.dtype_to_numpy(dtype)
+    tol = 1e-4 if dtype == wp.float32 else 1e-6
+
     # Create test data
     rng = np.random.default_rng(42)
-    L_h = np.triu(rng.random((TILE_M, TILE_M)))  # Upper triangular matrix
-    x_h = rng.random(TILE_M)
-    z_h = np.zeros_like(x_h)
-
-    # Compute reference solution using numpy
-    z_np = np.linalg.solve(L_h.T, x_h)
+    # Well conditioned upper triangular matrix
+    L_h = (np.triu(rng.random((TILE_M, TILE_M))) + np.eye(TILE_M)).astype(np_dtype)
+    x_h = rng.random(TILE_M).astype(np_dtype)
 
     # Create Warp arrays
-    L_wp = wp.array2d(L_h, requires_grad=True, dtype=wp.float64, device=device)
-    x_wp = wp.array1d(x_h, requires_grad=True, dtype=wp.float64, device=device)
-    z_wp = wp.array1d(z_h, requires_grad=True, dtype=wp.float64, device=device)
+    L_wp = wp.array2d(L_h, requires_grad=True, dtype=dtype, device=device)
+    x_wp = wp.array1d(x_h, requires_grad=True, dtype=dtype, device=device)
+    z_wp = wp.zeros_like(x_wp)
 
     # Run kernel
     wp.launch_tiled(
         tile_math_forward_substitution, dim=[1, 1], inputs=[L_wp, x_wp, z_wp], block_dim=TILE_DIM, device=device
     )
-    wp.synchronize_device(device)
+
+    # Compute reference solution using numpy
+    z_np = np.linalg.solve(L_h.T, x_h)
 
     # Verify results
-    np.testing.assert_allclose(z_wp.numpy(), z_np)
+    assert_np_equal(z_wp.numpy(), z_np, tol=tol)
 
     # TODO: implement and test backward pass
 
 
 @wp.kernel
-def tile_math_back_substitution(
-    gL: wp.array2d(dtype=wp.float64), gx: wp.array1d(dtype=wp.float64), gz: wp.array1d(dtype=wp.float64)
-):
+def tile_math_back_substitution(gL: wp.array2d(dtype=Any), gx: wp.array1d(dtype=Any), gz: wp.array1d(dtype=Any)):
     i, j = wp.tid()
     # Load L & x
     L = wp.tile_load(gL, shape=(TILE_M, TILE_M), storage="shared")
@@ -314,39 +519,41 @@ def tile_math_back_substitution(
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_back_substitution(test, device):
+def test_tile_math_back_substitution(test, device, dtype=wp.float64):
+    np_dtype = wp.dtype_to_numpy(dtype)
+    tol = 1e-4 if dtype == wp.float32 else 1e-6
+
     # Create test data
     rng = np.random.default_rng(42)
-    L_h = np.tril(rng.random((TILE_M, TILE_M)))  # Lower triangular matrix
-    x_h = rng.random(TILE_M)
-    z_h = np.zeros_like(x_h)
-
-    # Compute reference solution using numpy
-    z_np = np.linalg.solve(L_h.T, x_h)
+    # Well conditioned lower triangular matrix
+    L_h = (np.tril(rng.random((TILE_M, TILE_M))) + np.eye(TILE_M)).astype(np_dtype)
+    x_h = rng.random(TILE_M).astype(np_dtype)
 
     # Create Warp arrays
-    L_wp = wp.array2d(L_h, requires_grad=True, dtype=wp.float64, device=device)
-    x_wp = wp.array1d(x_h, requires_grad=True, dtype=wp.float64, device=device)
-    z_wp = wp.array1d(z_h, requires_grad=True, dtype=wp.float64, device=device)
+    L_wp = wp.array2d(L_h, requires_grad=True, dtype=dtype, device=device)
+    x_wp = wp.array1d(x_h, requires_grad=True, dtype=dtype, device=device)
+    z_wp = wp.zeros_like(x_wp)
 
     # Run kernel
     wp.launch_tiled(
         tile_math_back_substitution, dim=[1, 1], inputs=[L_wp, x_wp, z_wp], block_dim=TILE_DIM, device=device
     )
-    wp.synchronize_device(device)
+
+    # Compute reference solution using numpy
+    z_np = np.linalg.solve(L_h.T, x_h)
 
     # Verify results
-    np.testing.assert_allclose(z_wp.numpy(), z_np)
+    assert_np_equal(z_wp.numpy(), z_np, tol=tol)
 
     # TODO: implement and test backward pass
 
 
 @wp.kernel
 def tile_math_forward_substitution_multiple_rhs(
-    gL: wp.array2d(dtype=wp.float64),
-    gx: wp.array2d(dtype=wp.float64),
-    gz: wp.array2d(dtype=wp.float64),
-    gc: wp.array2d(dtype=wp.float64),
+    gL: wp.array2d(dtype=Any),
+    gx: wp.array2d(dtype=Any),
+    gz: wp.array2d(dtype=Any),
+    gc: wp.array2d(dtype=Any),
 ):
     i, j = wp.tid()
     # Load L & x
@@ -365,23 +572,21 @@ def tile_math_forward_substitution_multiple_rhs(
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_forward_substitution_multiple_rhs(test, device):
+def test_tile_math_forward_substitution_multiple_rhs(test, device, dtype=wp.float64):
+    np_dtype = wp.dtype_to_numpy(dtype)
+    tol = 1e-4 if dtype == wp.float32 else 1e-6
+
     # Create test data
     rng = np.random.default_rng(42)
-    L_h = np.tril(rng.random((TILE_M, TILE_M)))  # Lower triangular matrix
-    x_h = rng.random((TILE_M, TILE_M))  # Multiple right-hand sides
-    z_h = np.zeros_like(x_h)
-    c_h = np.zeros_like(x_h)
-
-    # Compute reference solution using numpy
-    z_np = np.linalg.solve(L_h, x_h.T)
-    c_np = z_np @ z_np
+    # Well conditioned lower triangular matrix
+    L_h = (np.tril(rng.random((TILE_M, TILE_M))) + np.eye(TILE_M)).astype(np_dtype)
+    x_h = rng.random((TILE_M, TILE_M)).astype(np_dtype)  # Multiple right-hand sides
 
     # Create Warp arrays
-    L_wp = wp.array2d(L_h, requires_grad=True, dtype=wp.float64, device=device)
-    x_wp = wp.array2d(x_h, requires_grad=True, dtype=wp.float64, device=device)
-    z_wp = wp.array2d(z_h, requires_grad=True, dtype=wp.float64, device=device)
-    c_wp = wp.array2d(c_h, requires_grad=True, dtype=wp.float64, device=device)
+    L_wp = wp.array2d(L_h, requires_grad=True, dtype=dtype, device=device)
+    x_wp = wp.array2d(x_h, requires_grad=True, dtype=dtype, device=device)
+    z_wp = wp.zeros_like(x_wp)
+    c_wp = wp.zeros_like(x_wp)
 
     # Run kernel
     wp.launch_tiled(
@@ -391,21 +596,24 @@ def test_tile_math_forward_substitution_multiple_rhs(test, device):
         block_dim=TILE_DIM,
         device=device,
     )
-    wp.synchronize_device()
+
+    # Compute reference solution using numpy
+    z_np = np.linalg.solve(L_h, x_h.T)
+    c_np = z_np @ z_np
 
     # Verify results
-    assert np.allclose(z_wp.numpy(), z_np)
-    assert np.allclose(c_wp.numpy(), c_np)
+    assert_np_equal(z_wp.numpy(), z_np, tol=tol)
+    assert_np_equal(c_wp.numpy(), c_np, tol=tol)
 
     # TODO: implement and test backward pass
 
 
 @wp.kernel
 def tile_math_back_substitution_multiple_rhs(
-    gL: wp.array2d(dtype=wp.float64),
-    gx: wp.array2d(dtype=wp.float64),
-    gz: wp.array2d(dtype=wp.float64),
-    gc: wp.array2d(dtype=wp.float64),
+    gL: wp.array2d(dtype=Any),
+    gx: wp.array2d(dtype=Any),
+    gz: wp.array2d(dtype=Any),
+    gc: wp.array2d(dtype=Any),
 ):
     i, j = wp.tid()
     # Load L & x
@@ -424,23 +632,21 @@ def tile_math_back_substitution_multiple_rhs(
 @unittest.skipUnless(
     wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
 )
-def test_tile_math_back_substitution_multiple_rhs(test, device):
+def test_tile_math_back_substitution_multiple_rhs(test, device, dtype=wp.float64):
+    np_dtype = wp.dtype_to_numpy(dtype)
+    tol = 1e-4 if dtype == wp.float32 else 1e-6
+
     # Create test data
     rng = np.random.default_rng(42)
-    L_h = np.tril(rng.random((TILE_M, TILE_M)))  # Lower triangular matrix
-    x_h = rng.random((TILE_M, TILE_M))  # Multiple right-hand sides
-    z_h = np.zeros_like(x_h)
-    c_h = np.zeros_like(x_h)
-
-    # Compute reference solution using numpy
-    z_np = np.linalg.solve(L_h.T, x_h.T)
-    c_np = z_np @ z_np
+    # Well conditioned lower triangular matrix
+    L_h = (np.tril(rng.random((TILE_M, TILE_M))) + np.eye(TILE_M)).astype(np_dtype)
+    x_h = rng.random((TILE_M, TILE_M)).astype(np_dtype)  # Multiple right-hand sides
 
     # Create Warp arrays
-    L_wp = wp.array2d(L_h, requires_grad=True, dtype=wp.float64, device=device)
-    x_wp = wp.array2d(x_h, requires_grad=True, dtype=wp.float64, device=device)
-    z_wp = wp.array2d(z_h, requires_grad=True, dtype=wp.float64, device=device)
-    c_wp = wp.array2d(c_h, requires_grad=True, dtype=wp.float64, device=device)
+    L_wp = wp.array2d(L_h, requires_grad=True, dtype=dtype, device=device)
+    x_wp = wp.array2d(x_h, requires_grad=True, dtype=dtype, device=device)
+    z_wp = wp.zeros_like(x_wp)
+    c_wp = wp.zeros_like(x_wp)
 
     # Run kernel
     wp.launch_tiled(
@@ -450,23 +656,32 @@ def test_tile_math_back_substitution_multiple_rhs(test, device):
         block_dim=TILE_DIM,
         device=device,
     )
-    wp.synchronize_device()
+
+    # Compute reference solution using numpy
+    z_np = np.linalg.solve(L_h.T, x_h.T)
+    c_np = z_np @ z_np
 
     # Verify results
-    assert np.allclose(z_wp.numpy(), z_np)
-    assert np.allclose(c_wp.numpy(), c_np)
+    assert_np_equal(z_wp.numpy(), z_np, tol=tol)
+    assert_np_equal(c_wp.numpy(), c_np, tol=tol)
 
     # TODO: implement and test backward pass
 
 
-# tests a complex composition of most libmathdx calls
-@unittest.skipUnless(
-    wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
-)
-def test_tile_math_block_cholesky(test, device):
-    BLOCK_SIZE = wp.constant(TILE_M // 2)
+# explicitly overload generic kernels to avoid module reloading during tests
+for T in (wp.float32, wp.float64):
+    wp.overload(
+        tile_math_cholesky_multiple_rhs,
+        [wp.array2d(dtype=T), wp.array1d(dtype=T), *[wp.array2d(dtype=T)] * 4],
+    )
+    wp.overload(tile_math_forward_substitution, [wp.array2d(dtype=T), wp.array1d(dtype=T), wp.array1d(dtype=T)])
+    wp.overload(tile_math_back_substitution, [wp.array2d(dtype=T), wp.array1d(dtype=T), wp.array1d(dtype=T)])
+    wp.overload(tile_math_forward_substitution_multiple_rhs, [wp.array2d(dtype=T)] * 4)
+    wp.overload(tile_math_back_substitution_multiple_rhs, [wp.array2d(dtype=T)] * 4)
+
 
-    @wp.kernel
+def create_block_cholesky_kernel(M: int, nb: int):
+    @wp.kernel(module="unique")
     def block_cholesky_kernel(
         A: wp.array2d(dtype=float),
         L: wp.array2d(dtype=float),
@@ -474,45 +689,46 @@ def test_tile_math_block_cholesky(test, device):
         """
         Computes the Cholesky factorization of a symmetric positive definite matrix A in blocks.
         It returns a lower-triangular matrix L such that A = L L^T.
+
+        Right-looking variant: once block column k is factored its rank-nb update is
+        applied to the trailing matrix, which is overwritten in A.
         """
 
         # Process the matrix in blocks along its leading dimension.
-        for k in range(0, TILE_M, BLOCK_SIZE):
-            end = k + BLOCK_SIZE
-
-            # Load current diagonal block A[k:end, k:end]
-            # and update with contributions from previously computed blocks.
-            A_kk_tile = wp.tile_load(A, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(k, k), storage="shared")
-
-            for j in range(0, k, BLOCK_SIZE):
-                L_block = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(k, j))
-                L_block_T = wp.tile_transpose(L_block)
-                L_L_T_block = wp.tile_matmul(L_block, L_block_T)
-                A_kk_tile -= L_L_T_block
-
-            # Compute the Cholesky factorization for the block
-            # print(A_kk_tile)
+        for k in range(0, M, nb):
+            # Block column k of L, kept in shared memory so the trailing update never reloads it from L.
+            # Initializing a shared tile synchronizes the block, this also makes the trailing update
+            # stored to A by the previous iteration visible to all threads before it is loaded below.
+            L_panel = wp.tile_zeros(shape=(M, nb), dtype=float, storage="shared")
+
+            # L11 = chol(A11)
+            A_kk_tile = wp.tile_load(A, shape=(nb, nb), offset=(k, k), storage="shared")
             L_kk_tile = wp.tile_cholesky(A_kk_tile)
             wp.tile_store(L, L_kk_tile, offset=(k, k))
 
-            # Process the blocks below the current block
-            for i in range(end, TILE_M, BLOCK_SIZE):
-                A_ik_tile = wp.tile_load(A, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(i, k), storage="shared")
-
-                for j in range(0, k, BLOCK_SIZE):
-                    L_tile = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(i, j))
-                    L_2_tile = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(k, j))
-                    L_T_tile = wp.tile_transpose(L_2_tile)
-                    L_L_T_tile = wp.tile_matmul(L_tile, L_T_tile)
-                    A_ik_tile -= L_L_T_tile
-
+            # L21 = A21 L11^-T
+            for i in range(k + nb, M, nb):
+                A_ik_tile = wp.tile_load(A, shape=(nb, nb), offset=(i, k), storage="shared")
                 A_ik_T_tile = wp.tile_transpose(A_ik_tile)
                 sol_T_tile = wp.tile_lower_solve(L_kk_tile, A_ik_T_tile)
                 sol_tile = wp.tile_transpose(sol_T_tile)
-
+                wp.tile_assign(L_panel, sol_tile, offset=(i, 0))
                 wp.tile_store(L, sol_tile, offset=(i, k))
 
-    @wp.kernel
+            # A22 -= L21 L21^T, only the lower triangle of blocks is needed
+            for i in range(k + nb, M, nb):
+                L_ik_tile = wp.tile_view(L_panel, offset=(i, 0), shape=(nb, nb))
+                for j in range(k + nb, i + nb, nb):
+                    L_jk_tile = wp.tile_view(L_panel, offset=(j, 0), shape=(nb, nb))
+                    A_ij_tile = wp.tile_load(A, shape=(nb, nb), offset=(i, j), storage="shared")
+                    wp.tile_matmul(-L_ik_tile, wp.tile_transpose(L_jk_tile), A_ij_tile)
+                    wp.tile_store(A, A_ij_tile, offset=(i, j))
+
+    return use_test_module_backend(block_cholesky_kernel)
+
+
+def create_block_cholesky_solve_kernel(M: int, nb: int):
+    @wp.kernel(module="unique")
     def block_cholesky_solve_kernel(
         L: wp.array2d(dtype=float),
         b: wp.array2d(dtype=float),
@@ -525,57 +741,72 @@ def test_tile_math_block_cholesky(test, device):
         """
 
         # Forward substitution: solve L y = b
-        for i in range(0, TILE_M, BLOCK_SIZE):
-            i_end = i + BLOCK_SIZE
-            rhs_tile = wp.tile_load(b, shape=(BLOCK_SIZE, 1), offset=(i, 0))
-            for j in range(0, i, BLOCK_SIZE):
-                L_block = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(i, j))
-                y_block = wp.tile_load(scratch, shape=(BLOCK_SIZE, 1), offset=(j, 0))
+        for i in range(0, M, nb):
+            rhs_tile = wp.tile_load(b, shape=(nb, 1), offset=(i, 0))
+            for j in range(0, i, nb):
+                L_block = wp.tile_load(L, shape=(nb, nb), offset=(i, j))
+                y_block = wp.tile_load(scratch, shape=(nb, 1), offset=(j, 0))
                 Ly_block = wp.tile_matmul(L_block, y_block)
                 rhs_tile -= Ly_block
-            L_tile = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(i, i))
+            L_tile = wp.tile_load(L, shape=(nb, nb), offset=(i, i))
             y_tile = wp.tile_lower_solve(L_tile, rhs_tile)
             wp.tile_store(scratch, y_tile, offset=(i, 0))
 
         # Backward substitution: solve L^T x = y
-        for i in range(TILE_M - BLOCK_SIZE, -1, -BLOCK_SIZE):
-            i_start = i
-            i_end = i_start + BLOCK_SIZE
-            rhs_tile = wp.tile_load(scratch, shape=(BLOCK_SIZE, 1), offset=(i_start, 0))
-            for j in range(i_end, TILE_M, BLOCK_SIZE):
-                L_tile = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(j, i_start))
+        for i in range(M - nb, -1, -nb):
+            i_end = i + nb
+            rhs_tile = wp.tile_load(scratch, shape=(nb, 1), offset=(i, 0))
+            for j in range(i_end, M, nb):
+                L_tile = wp.tile_load(L, shape=(nb, nb), offset=(j, i))
                 L_T_tile = wp.tile_transpose(L_tile)
-                x_tile = wp.tile_load(x, shape=(BLOCK_SIZE, 1), offset=(j, 0))
+                x_tile = wp.tile_load(x, shape=(nb, 1), offset=(j, 0))
                 L_T_x_tile = wp.tile_matmul(L_T_tile, x_tile)
                 rhs_tile -= L_T_x_tile
-            L_tile = wp.tile_load(L, shape=(BLOCK_SIZE, BLOCK_SIZE), offset=(i_start, i_start))
+            L_tile = wp.tile_load(L, shape=(nb, nb), offset=(i, i))
             x_tile = wp.tile_upper_solve(wp.tile_transpose(L_tile), rhs_tile)
-            wp.tile_store(x, x_tile, offset=(i_start, 0))
+            wp.tile_store(x, x_tile, offset=(i, 0))
+
+    return use_test_module_backend(block_cholesky_solve_kernel)
+
+
+# tests a complex composition of most libmathdx calls
+@unittest.skipUnless(
+    wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
+)
+def test_tile_math_block_cholesky(test, device, M, block_dim=TILE_DIM):
+    # 16x16 blocks match the Tensor Core shape used by the trailing update
+    nb = min(16, M)
+    tol = 1e-6 * (M // 8)
+
+    block_cholesky_kernel = create_block_cholesky_kernel(M, nb)
+    block_cholesky_solve_kernel = create_block_cholesky_solve_kernel(M, nb)
 
     # check block cholesky decomposition
 
     rng = np.random.default_rng(42)
 
-    M = np.array(rng.random((TILE_M, TILE_M)), dtype=float)
+    R = np.array(rng.random((M, M)), dtype=float)
 
-    A_np = M.T @ M + np.eye(TILE_M, TILE_M)
-    L_np = np.linalg.cholesky(A_np)
+    # keep A well conditioned as M grows so float32 tolerances stay meaningful
+    A_np = R.T @ R + M * np.eye(M, M)
 
+    # the trailing update is applied in place, factor a copy of A
     A_wp = wp.array2d(A_np, dtype=float, device=device)
     L_wp = wp.zeros_like(A_wp)
 
-    wp.launch_tiled(block_cholesky_kernel, dim=1, inputs=[A_wp], outputs=[L_wp], block_dim=TILE_DIM, device=device)
+    wp.launch_tiled(block_cholesky_kernel, dim=1, inputs=[A_wp], outputs=[L_wp], block_dim=block_dim, device=device)
 
-    # check block cholesky solve
+    L_np = np.linalg.cholesky(A_np)
+
+    assert_np_equal(L_wp.numpy(), L_np, tol=tol)
 
-    assert_np_equal(L_wp.numpy(), L_np, tol=1e-6)
+    # check block cholesky solve
 
-    b_np = np.array(rng.random((TILE_M, 1)), dtype=float)
+    b_np = np.array(rng.random((M, 1)), dtype=float)
     b_wp = wp.array(b_np, dtype=float, device=device)
 
     scratch = wp.zeros_like(b_wp)
 
-    x_np = np.linalg.solve(L_np.T, np.linalg.solve(L_np, b_np))
     x_wp = wp.zeros_like(b_wp)
 
     wp.launch_tiled(
@@ -583,11 +814,13 @@ def test_tile_math_block_cholesky(test, device):
         dim=1,
         inputs=[L_wp, b_wp, scratch],
         outputs=[x_wp],
-        block_dim=TILE_DIM,
+        block_dim=block_dim,
         device=device,
     )
 
-    assert_np_equal(x_wp.numpy(), x_np, tol=1e-6)
+    x_np = np.linalg.solve(L_np.T, np.linalg.solve(L_np, b_np))
+
+    assert_np_equal(x_wp.numpy(), x_np, tol=tol)
 
 
 @wp.kernel
@@ -639,6 +872,150 @@ def test_tile_math_singular_matrices(test, device):
     assert np.isnan(x_wp.numpy()).any()
 
 
+# replays several tile math kernels from a single CUDA graph
+@unittest.skipUnless(
+    wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
+)
+def test_tile_math_graph(test, device):
+    rng = np.random.default_rng(42)
+
+    A = rng.random((TILE_M, TILE_K), dtype=np.float64).astype(np.float16)
+    B = rng.random((TILE_K, TILE_N), dtype=np.float32)
+    L_h = np.tril(rng.random((TILE_M, TILE_M))) + np.eye(TILE_M)  # Well conditioned lower triangular matrix
+
+    A_wp = wp.array(A, device=device)
+    B_wp = wp.array(B, device=device)
+    C_wp = wp.zeros((TILE_M, TILE_N), dtype=wp.float64, device=device)
+    L_wp = wp.array2d(L_h, dtype=wp.float64, device=device)
+    x_wp = wp.zeros((TILE_M, TILE_M), dtype=wp.float64, device=device)
+    z_wp = wp.zeros_like(x_wp)
+    c_wp = wp.zeros_like(x_wp)
+
+    def launch_kernels():
+        wp.launch_tiled(
+            tile_math_matmul_mixed_kernel,
+            dim=[1, 1],
+            inputs=[A_wp, B_wp, C_wp],
+            block_dim=TILE_DIM,
+            device=device,
+        )
+        wp.launch_tiled(
+            tile_math_forward_substitution_multiple_rhs,
+            dim=[1, 1],
+            inputs=[L_wp, x_wp, z_wp, c_wp],
+            block_dim=TILE_DIM,
+            device=device,
+        )
+
+    # warm up with the same block_dim as the captured launches so the module
+    # is compiled and loaded for it before the capture starts
+    launch_kernels()
+
+    with wp.ScopedCapture(device, force_module_load=False) as capture:
+        launch_kernels()
+
+    # replay the graph for new right-hand sides written in place
+    for _ in range(2):
+        x_h = rng.random((TILE_M, TILE_M))
+        x_wp.assign(x_h)
+
+        wp.capture_launch(capture.graph)
+
+        z_np = np.linalg.solve(L_h, x_h.T)
+
+        assert_np_equal(C_wp.numpy(), A @ B, tol=1e-2)
+        assert_np_equal(z_wp.numpy(), z_np, tol=1e-6)
+        assert_np_equal(c_wp.numpy(), z_np @ z_np, tol=1e-6)
+
+
+def create_tile_math_matmul_fp64_kernel():
+    @wp.kernel(module="unique")
+    def tile_math_matmul_fp64(
+        ga: wp.array2d(dtype=wp.float64), gb: wp.array2d(dtype=wp.float64), gc: wp.array2d(dtype=wp.float64)
+    ):
+        i, j = wp.tid()
+        a = wp.tile_load(ga, shape=(TILE_M, TILE_K))
+        b = wp.tile_load(gb, shape=(TILE_K, TILE_N))
+        c = wp.tile_matmul(a, b)
+        wp.tile_store(gc, c)
+
+    return tile_math_matmul_fp64
+
+
+@unittest.skipUnless(wp.context.runtime.core.wp_is_mathdx_enabled(), "Warp was not built with MathDx support")
+@unittest.skipUnless(
+    wp.context.runtime.core.wp_cuda_toolkit_version() >= 12060, "CUDA toolkit version is less than 12.6"
+)
+def test_tile_math_lto_cache(test, device):
+    rng = np.random.default_rng(42)
+
+    A = rng.random((TILE_M, TILE_K))
+    B = rng.random((TILE_K, TILE_N))
+
+    A_wp = wp.array2d(A, dtype=wp.float64, device=device)
+    B_wp = wp.array2d(B, dtype=wp.float64, device=device)
+    C_wp = wp.zeros((TILE_M, TILE_N), dtype=wp.float64, device=device)
+
+    # modules loaded from the kernel cache do not request their LTOs, always build them here
+    saved_cache_kernels = wp.config.cache_kernels
+    wp.config.cache_kernels = False
+
+    try:
+        wp.clear_lto_cache()
+        test.assertEqual(len(wp.build._lto_cache), 0)
+
+        wp.launch_tiled(
+            create_tile_math_matmul_fp64_kernel(),
+            dim=[1, 1],
+            inputs=[A_wp, B_wp, C_wp],
+            block_dim=TILE_DIM,
+            device=device,
+        )
+
+        cached = dict(wp.build._lto_cache)
+        test.assertGreater(len(cached), 0)
+
+        # a second module requesting the same LTO gets the cached entry instead of building it again
+        wp.launch_tiled(
+            create_tile_math_matmul_fp64_kernel(),
+            dim=[1, 1],
+            inputs=[A_wp, B_wp, C_wp],
+            block_dim=TILE_DIM,
+            device=device,
+        )
+
+        test.assertEqual(cached.keys(), wp.build._lto_cache.keys())
+        for symbol, entry in cached.items():
+            test.assertIs(wp.build._lto_cache[symbol], entry)
+
+        wp.clear_lto_cache()
+        test.assertEqual(len(wp.build._lto_cache), 0)
+    finally:
+        wp.config.cache_kernels = saved_cache_kernels
+
+    assert_np_equal(C_wp.numpy(), A @ B, tol=1e-10)
+
+
+def run_with_native_backend(test_func):
+    # dispatch the tile math builtins of this module to Warp's own implementations instead of MathDx
+    def test_native(test, device, **kwargs):
+        wp.set_module_options({"enable_mathdx": False})
+        try:
+            test_func(test, device, **kwargs)
+        finally:
+            wp.set_module_options({"enable_mathdx": True})
+
+    return test_native
+
+
+def use_test_module_backend(kernel):
+    # kernels created by the factories live in their own unique module, forward
+    # the backend selected for this module by run_with_native_backend()
+    kernel.module.options["enable_mathdx"] = wp.get_module_options()["enable_mathdx"]
+    kernel.module.mark_modified()
+    return kernel
+
+
 all_devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
 
@@ -652,27 +1029,95 @@ add_function_test(
     TestTileMathDx, "test_tile_math_matmul", test_tile_math_matmul, devices=all_devices, check_output=False
 )
 add_function_test(
-    TestTileMathDx, "test_tile_math_cholesky", test_tile_math_cholesky, devices=all_devices, check_output=False
+    TestTileMathDx,
+    "test_tile_math_matmul_mixed",
+    test_tile_math_matmul_mixed,
+    devices=all_devices,
+    check_output=False,
+)
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_matmul_tf32",
+    test_tile_math_matmul_tf32,
+    devices=all_devices,
+    check_output=False,
+)
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_cholesky",
+    test_tile_math_cholesky,
+    devices=all_devices,
+    check_output=False,
+    M=TILE_M,
+)
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_cholesky_fp32",
+    test_tile_math_cholesky,
+    devices=all_devices,
+    check_output=False,
+    M=TILE_M,
+    dtype=wp.float32,
+)
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_cholesky_upper",
+    test_tile_math_cholesky,
+    devices=all_devices,
+    check_output=False,
+    M=TILE_M,
+    fill_mode="upper",
+)
+# float64 64x64 tiles need more than 48KB of shared memory
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_cholesky_large",
+    test_tile_math_cholesky,
+    devices=all_devices,
+    check_output=False,
+    M=64,
 )
 add_function_test(
     TestTileMathDx,
-    "tile_math_cholesky_multiple_rhs",
-    tile_math_cholesky_multiple_rhs,
+    "test_tile_math_cholesky_multiple_rhs",
+    test_tile_math_cholesky_multiple_rhs,
     devices=all_devices,
     check_output=False,
 )
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_cholesky_multiple_rhs_fp32",
+    test_tile_math_cholesky_multiple_rhs,
+    devices=all_devices,
+    check_output=False,
+    dtype=wp.float32,
+)
 add_function_test(
     TestTileMathDx,
     "test_tile_math_fft_vec2f",
     functools.partial(test_tile_math_fft, wp_dtype=wp.vec2f),
-    devices=cuda_devices,
+    devices=all_devices,
     check_output=False,
 )
 add_function_test(
     TestTileMathDx,
     "test_tile_math_fft_vec2d",
     functools.partial(test_tile_math_fft, wp_dtype=wp.vec2d),
-    devices=cuda_devices,
+    devices=all_devices,
+    check_output=False,
+)
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_ifft_vec2f",
+    functools.partial(test_tile_math_ifft, wp_dtype=wp.vec2f),
+    devices=all_devices,
+    check_output=False,
+)
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_ifft_vec2d",
+    functools.partial(test_tile_math_ifft, wp_dtype=wp.vec2d),
+    devices=all_devices,
     check_output=False,
 )
 
@@ -684,6 +1129,15 @@ add_function_test(
     check_output=False,
 )
 
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_forward_substitution_fp32",
+    test_tile_math_forward_substitution,
+    devices=cuda_devices,
+    check_output=False,
+    dtype=wp.float32,
+)
+
 add_function_test(
     TestTileMathDx,
     "test_tile_math_back_substitution",
@@ -692,6 +1146,15 @@ add_function_test(
     check_output=False,
 )
 
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_back_substitution_fp32",
+    test_tile_math_back_substitution,
+    devices=cuda_devices,
+    check_output=False,
+    dtype=wp.float32,
+)
+
 add_function_test(
     TestTileMathDx,
     "test_tile_math_forward_substitution_multiple_rhs",
@@ -700,6 +1163,15 @@ add_function_test(
     check_output=False,
 )
 
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_forward_substitution_multiple_rhs_fp32",
+    test_tile_math_forward_substitution_multiple_rhs,
+    devices=cuda_devices,
+    check_output=False,
+    dtype=wp.float32,
+)
+
 add_function_test(
     TestTileMathDx,
     "test_tile_math_back_substitution_multiple_rhs",
@@ -710,12 +1182,33 @@ add_function_test(
 
 add_function_test(
     TestTileMathDx,
-    "test_tile_math_block_cholesky",
-    test_tile_math_block_cholesky,
+    "test_tile_math_back_substitution_multiple_rhs_fp32",
+    test_tile_math_back_substitution_multiple_rhs,
     devices=cuda_devices,
     check_output=False,
+    dtype=wp.float32,
 )
 
+for M in (8, 32, 128):
+    add_function_test(
+        TestTileMathDx,
+        f"test_tile_math_block_cholesky_{M}",
+        test_tile_math_block_cholesky,
+        devices=cuda_devices,
+        check_output=False,
+        M=M,
+    )
+    # several warps per block catch missing synchronization between stores and reloads
+    add_function_test(
+        TestTileMathDx,
+        f"test_tile_math_block_cholesky_{M}_block_dim_128",
+        test_tile_math_block_cholesky,
+        devices=cuda_devices,
+        check_output=False,
+        M=M,
+        block_dim=128,
+    )
+
 add_function_test(
     TestTileMathDx,
     "test_tile_math_singular_matrices",
@@ -724,6 +1217,49 @@ add_function_test(
     check_output=False,
 )
 
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_graph",
+    test_tile_math_graph,
+    devices=cuda_devices,
+    check_output=False,
+)
+
+add_function_test(
+    TestTileMathDx,
+    "test_tile_math_lto_cache",
+    test_tile_math_lto_cache,
+    devices=cuda_devices,
+    check_output=False,
+)
+
+# the CPU always uses Warp's own implementations, only CUDA devices need a separate native run
+for name, func in (
+    ("test_tile_math_matmul", test_tile_math_matmul),
+    ("test_tile_math_matmul_mixed", test_tile_math_matmul_mixed),
+    ("test_tile_math_matmul_tf32", test_tile_math_matmul_tf32),
+    ("test_tile_math_fft_vec2f", functools.partial(test_tile_math_fft, wp_dtype=wp.vec2f)),
+    ("test_tile_math_fft_vec2d", functools.partial(test_tile_math_fft, wp_dtype=wp.vec2d)),
+    ("test_tile_math_ifft_vec2f", functools.partial(test_tile_math_ifft, wp_dtype=wp.vec2f)),
+    ("test_tile_math_ifft_vec2d", functools.partial(test_tile_math_ifft, wp_dtype=wp.vec2d)),
+    ("test_tile_math_forward_substitution", test_tile_math_forward_substitution),
+    ("test_tile_math_back_substitution", test_tile_math_back_substitution),
+    ("test_tile_math_forward_substitution_multiple_rhs", test_tile_math_forward_substitution_multiple_rhs),
+    ("test_tile_math_back_substitution_multiple_rhs", test_tile_math_back_substitution_multiple_rhs),
+    ("test_tile_math_cholesky", functools.partial(test_tile_math_cholesky, M=TILE_M)),
+    ("test_tile_math_cholesky_fp32", functools.partial(test_tile_math_cholesky, M=TILE_M, dtype=wp.float32)),
+    ("test_tile_math_cholesky_upper", functools.partial(test_tile_math_cholesky, M=TILE_M, fill_mode="upper")),
+    ("test_tile_math_cholesky_multiple_rhs", test_tile_math_cholesky_multiple_rhs),
+    ("test_tile_math_block_cholesky_32", functools.partial(test_tile_math_block_cholesky, M=32)),
+):
+    add_function_test(
+        TestTileMathDx,
+        f"{name}_native",
+        run_with_native_backend(func),
+        devices=cuda_devices,
+        check_output=False,
+    )
+
 
 if __name__ == "__main__":
     wp.clear_kernel_cache()